@@ -0,0 +1,44 @@
+"""JSON serialization helpers, using orjson when it is installed."""
+
+import json
+from typing import IO, Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+else:
+
+    def loads(data: bytes) -> Any:
+        """Parse JSON from bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to JSON bytes."""
+        if indent:
+            return json.dumps(obj, indent=2).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def iter_items(fp: IO[bytes], key: str) -> Iterator[Any]:
+    """Iterate over a top-level JSON array, streaming it when ijson is installed."""
+    if ijson is not None:
+        return ijson.items(fp, f"{key}.item", use_float=True)
+    return iter(loads(fp.read())[key])
@@ -1,6 +1,5 @@
 """Command-line interface for Cloud Asset Intelligence."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +8,7 @@ from rich.console import Console
 from rich.table import Table
 
 from . import __version__
+from ._json import dumps, iter_items, loads
 from .scanner import scan_aws_resources
 from .fingerprint import generate_fingerprint_clusters
 from .matcher import identify_orphans
@@ -51,6 +51,7 @@ def scan(
         "output/resources.json", "--output", "-o", help="Output file path"
     ),
     all_regions: bool = typer.Option(False, "--all-regions", help="Scan all AWS regions"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the JSON output"),
 ):
     """Scan AWS account for all tagged resources."""
     console.print("[bold blue]🔍 Scanning AWS resources...[/bold blue]")
@@ -63,8 +64,8 @@ def scan(
         output.parent.mkdir(parents=True, exist_ok=True)
         
         # Save results
-        with open(output, "w") as f:
-            json.dump(resources, f, indent=2)
+        with open(output, "wb") as f:
+            f.write(dumps(resources, indent=pretty))
         
         console.print(f"[green]✓[/green] Found {resources['total_resources']} resources")
         console.print(f"[green]✓[/green] Saved to: {output}")
@@ -82,22 +83,23 @@ def fingerprint(
     output: Path = typer.Option(
         "output/fingerprint-clusters.json", "--output", "-o", help="Output file path"
     ),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the JSON output"),
 ):
     """Generate fingerprint clusters from discovered resources."""
     console.print("[bold blue]🔬 Generating fingerprint clusters...[/bold blue]")
     
     try:
         # Load resources
-        with open(resources) as f:
-            resource_data = json.load(f)
+        with open(resources, "rb") as f:
+            resource_data = loads(f.read())
         
         # Generate clusters
         clusters = generate_fingerprint_clusters(resource_data["resources"])
         
         # Save results
         output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w") as f:
-            json.dump(clusters, f, indent=2)
+        with open(output, "wb") as f:
+            f.write(dumps(clusters, indent=pretty))
         
         console.print(f"[green]✓[/green] Generated {clusters['total_clusters']} clusters")
         console.print(f"[green]✓[/green] Saved to: {output}")
@@ -121,26 +123,26 @@ def identify(
     output: Path = typer.Option(
         "output/orphan-report.json", "--output", "-o", help="Output file path"
     ),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the JSON output"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse the parsed registry cache"),
 ):
     """Identify orphaned resources by matching to known projects."""
     console.print("[bold blue]🔎 Identifying orphaned resources...[/bold blue]")
     
     try:
-        # Load resources
-        with open(resources) as f:
-            resource_data = json.load(f)
-        
-        # Identify orphans
-        report = identify_orphans(
-            resource_data["resources"],
-            registry_path=registry,
-            threshold=threshold
-        )
+        # Stream resources from disk while identifying orphans
+        with open(resources, "rb") as f:
+            report = identify_orphans(
+                iter_items(f, "resources"),
+                registry_path=registry,
+                threshold=threshold,
+                use_cache=cache,
+            )
         
         # Save JSON report
         output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w") as f:
-            json.dump(report, f, indent=2)
+        with open(output, "wb") as f:
+            f.write(dumps(report, indent=pretty))
         
         # Display summary
         total = report["total_resources"]
@@ -193,8 +195,8 @@ def register(
         output_path = Path(f"examples/project-fingerprints/{name}.json")
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w") as f:
-            json.dump(fingerprint, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(dumps(fingerprint, indent=True))
         
         console.print(f"[green]✓[/green] Project registered: {output_path}")
         
@@ -1,8 +1,39 @@
 """Fingerprint extraction and clustering for cloud resources."""
 
-from collections import defaultdict
+import sys
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# C-level field accessors; map() with these avoids a Python frame per tag
+_get_key = itemgetter("Key")
+_get_keyvalue = itemgetter("Key", "Value")
+
+# Resources overwhelmingly repeat the same tag sets, so fingerprints are
+# memoized by the raw (unsorted) tag fields in bounded LRU caches. Tag keys
+# come from a small vocabulary and are interned so they compare by identity;
+# values are left alone since they are high-cardinality and not always str
+FINGERPRINT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def _sorted_keys(raw: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Sort and intern raw tag keys."""
+    return tuple(map(sys.intern, sorted(raw)))
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def _sorted_keyvalues(raw: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Sort raw (key, value) pairs and intern their keys."""
+    return tuple((sys.intern(key), value) for key, value in sorted(raw))
+
+
+def clear_fingerprint_cache() -> None:
+    """Discard all memoized fingerprints."""
+    _sorted_keys.cache_clear()
+    _sorted_keyvalues.cache_clear()
 
 
 def extract_key_fingerprint(tags: List[Dict[str, str]]) -> Tuple[str, ...]:
@@ -15,7 +46,20 @@ def extract_key_fingerprint(tags: List[Dict[str, str]]) -> Tuple[str, ...]:
     Returns:
         Sorted tuple of tag keys
     """
-    return tuple(sorted(tag["Key"] for tag in tags))
+    return _sorted_keys(tuple(map(_get_key, tags)))
+
+
+def extract_key_fingerprints(tag_lists: Iterable[List[Dict[str, str]]]) -> List[Tuple[str, ...]]:
+    """
+    Extract tag key fingerprints for many resources at once.
+    
+    Args:
+        tag_lists: Iterable of per-resource tag lists
+        
+    Returns:
+        List of sorted tag key tuples, in input order
+    """
+    return list(map(extract_key_fingerprint, tag_lists))
 
 
 def extract_keyvalue_fingerprint(tags: List[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
@@ -28,7 +72,7 @@ def extract_keyvalue_fingerprint(tags: List[Dict[str, str]]) -> Tuple[Tuple[str,
     Returns:
         Sorted tuple of (key, value) pairs
     """
-    return tuple(sorted((tag["Key"], tag["Value"]) for tag in tags))
+    return _sorted_keyvalues(tuple(map(_get_keyvalue, tags)))
 
 
 def generate_fingerprint_clusters(resources: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -41,21 +85,22 @@ def generate_fingerprint_clusters(resources: List[Dict[str, Any]]) -> Dict[str,
     Returns:
         Dictionary with cluster information
     """
-    key_clusters = defaultdict(list)
-    keyvalue_clusters = defaultdict(list)
+    key_clusters: Dict[Tuple[str, ...], List[str]] = {}
+    keyvalue_clusters: Dict[Tuple[Tuple[str, Any], ...], List[str]] = {}
     
     for resource in resources:
         tags = resource.get("tags", [])
         if not tags:
             continue
         
-        # Extract fingerprints
-        key_fp = extract_key_fingerprint(tags)
+        # Extract fingerprints; the key-value fingerprint is sorted by key
+        # first, so the key fingerprint can be read off it without re-sorting
         keyvalue_fp = extract_keyvalue_fingerprint(tags)
+        key_fp = tuple(key for key, _ in keyvalue_fp)
         
         # Add to clusters
-        key_clusters[key_fp].append(resource["arn"])
-        keyvalue_clusters[keyvalue_fp].append(resource["arn"])
+        key_clusters.setdefault(key_fp, []).append(resource["arn"])
+        keyvalue_clusters.setdefault(keyvalue_fp, []).append(resource["arn"])
     
     # Format output
     clusters = []
@@ -74,11 +119,11 @@ def generate_fingerprint_clusters(resources: List[Dict[str, Any]]) -> Dict[str,
     
     # Add key-value clusters
     cluster_id = 1
-    for fingerprint, arns in keyvalue_clusters.items():
+    for pairs, arns in keyvalue_clusters.items():
         clusters.append({
             "cluster_id": f"keyvalue-{cluster_id}",
             "fingerprint_type": "keyvalue",
-            "fingerprint": [list(pair) for pair in fingerprint],
+            "fingerprint": [list(pair) for pair in pairs],
             "resource_count": len(arns),
             "resources": arns,
         })
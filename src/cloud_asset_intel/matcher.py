@@ -1,11 +1,16 @@
 """Resource matching and orphan identification."""
 
-import json
+import hashlib
+import os
+import pickle
+import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
-from .fingerprint import extract_key_fingerprint, extract_keyvalue_fingerprint
+from . import __version__
+from ._json import loads
 
 
 # Critical tags with importance weights
@@ -16,12 +21,20 @@ CRITICAL_TAGS = {
     "Environment": 0.1,
     "CostCenter": 0.1,
 }
+CRITICAL_TAG_KEYS = frozenset(CRITICAL_TAGS)
+
+# (project, project_keys, key_weights, total_weight) as built by compile_projects
+CompiledProject = Tuple[Dict[str, Any], FrozenSet[str], Tuple[Tuple[str, float], ...], float]
+
+# (always_scored, critical_key -> project positions) as built by build_project_index
+ProjectIndex = Tuple[List[int], Dict[str, List[int]]]
 
 
 def calculate_match_confidence(
     resource_tags: List[Dict[str, str]],
     project_fingerprint: Dict[str, Any],
     use_weighted: bool = True,
+    project_keys: Optional[FrozenSet[str]] = None,
 ) -> float:
     """
     Calculate confidence score for resource matching project fingerprint.
@@ -30,22 +43,38 @@ def calculate_match_confidence(
         resource_tags: List of tag dictionaries
         project_fingerprint: Project fingerprint dictionary
         use_weighted: Use weighted scoring based on critical tags
+        project_keys: Precomputed project tag keys (derived from the
+            fingerprint when omitted)
         
     Returns:
         Confidence score (0.0 to 1.0)
     """
-    resource_keys = set(tag["Key"] for tag in resource_tags)
-    project_keys = set(project_fingerprint["fingerprints"]["key_fingerprint"])
+    if project_keys is None:
+        project_keys = frozenset(project_fingerprint["fingerprints"]["key_fingerprint"])
     
+    return _confidence_from_keys(
+        set(tag["Key"] for tag in resource_tags), project_keys, use_weighted
+    )
+
+
+def _confidence_from_keys(
+    resource_keys: AbstractSet[str],
+    project_keys: FrozenSet[str],
+    use_weighted: bool = True,
+) -> float:
+    """Calculate match confidence from precomputed resource and project key sets."""
     if not project_keys:
         return 0.0
     
+    if use_weighted:
+        key_weights = _key_weights(project_keys)
+        return _weighted_confidence(
+            resource_keys, key_weights, sum(weight for _, weight in key_weights)
+        )
+    
     # Calculate overlap
     overlap = len(resource_keys & project_keys)
     
-    if use_weighted:
-        return _weighted_confidence(resource_tags, project_fingerprint)
-    
     # Base score: percentage of project tags present
     base_score = overlap / len(project_keys)
     
@@ -54,38 +83,36 @@ def calculate_match_confidence(
     extra_penalty = min(0.2, extra_tags * 0.05)
     
     # Bonus for critical tag matches
-    critical_overlap = len(resource_keys & set(CRITICAL_TAGS.keys()) & project_keys)
+    critical_overlap = len(resource_keys & CRITICAL_TAG_KEYS & project_keys)
     critical_bonus = critical_overlap * 0.1
     
     confidence = base_score - extra_penalty + critical_bonus
     return max(0.0, min(1.0, confidence))
 
 
+def _key_weights(project_keys: FrozenSet[str]) -> Tuple[Tuple[str, float], ...]:
+    """Pair each project tag key with its importance weight."""
+    return tuple((tag_key, CRITICAL_TAGS.get(tag_key, 0.05)) for tag_key in project_keys)
+
+
 def _weighted_confidence(
-    resource_tags: List[Dict[str, str]],
-    project_fingerprint: Dict[str, Any],
+    resource_keys: AbstractSet[str],
+    key_weights: Tuple[Tuple[str, float], ...],
+    total_weight: float,
 ) -> float:
     """Calculate confidence with tag importance weighting."""
-    resource_keys = {tag["Key"]: tag["Value"] for tag in resource_tags}
-    project_keys = set(project_fingerprint["fingerprints"]["key_fingerprint"])
-    
-    total_weight = 0.0
-    matched_weight = 0.0
-    
-    for tag_key in project_keys:
-        weight = CRITICAL_TAGS.get(tag_key, 0.05)
-        total_weight += weight
-        
-        if tag_key in resource_keys:
-            matched_weight += weight
+    if total_weight <= 0:
+        return 0.0
     
-    return matched_weight / total_weight if total_weight > 0 else 0.0
+    matched_weight = sum(weight for tag_key, weight in key_weights if tag_key in resource_keys)
+    return matched_weight / total_weight
 
 
 def match_resource_to_projects(
     resource: Dict[str, Any],
     projects: List[Dict[str, Any]],
     threshold: float = 0.6,
+    include_details: bool = True,
 ) -> Tuple[Optional[Dict[str, Any]], float, Dict[str, Any]]:
     """
     Match a resource to known projects.
@@ -94,25 +121,181 @@ def match_resource_to_projects(
         resource: Resource dictionary with 'arn' and 'tags'
         projects: List of project fingerprint dictionaries
         threshold: Minimum confidence threshold
+        include_details: Build the match_details analysis for the best match
         
     Returns:
         Tuple of (best_match_project, confidence, match_details)
     """
-    best_match = None
-    best_confidence = 0.0
-    best_details = {}
+    return match_resource_to_compiled(
+        resource, compile_projects(projects), threshold, include_details=include_details
+    )
+
+
+def compile_projects(projects: List[Dict[str, Any]]) -> List[CompiledProject]:
+    """
+    Precompute per-project matching data.
+    
+    Args:
+        projects: List of project fingerprint dictionaries
+        
+    Returns:
+        List of (project, project_keys, key_weights, total_weight) tuples
+    """
+    compiled = []
+    for project in projects:
+        # Interned keys make the per-resource set lookups pointer comparisons
+        project_keys = frozenset(map(sys.intern, project["fingerprints"]["key_fingerprint"]))
+        key_weights = _key_weights(project_keys)
+        total_weight = sum(weight for _, weight in key_weights)
+        compiled.append((project, project_keys, key_weights, total_weight))
+    return compiled
+
+
+def build_project_index(compiled: List[CompiledProject], threshold: float) -> ProjectIndex:
+    """
+    Index compiled projects by the critical tags they contain.
+    
+    A resource that shares no critical tag with a project can only reach
+    the threshold through the project's non-critical tags. Projects whose
+    non-critical weight alone could do that are always scored; the rest
+    are only scored for resources carrying one of their critical tags.
+    
+    Args:
+        compiled: Output of compile_projects
+        threshold: Confidence threshold the index will be used with
+        
+    Returns:
+        Tuple of (always-scored positions, critical tag -> positions)
+    """
+    always_scored = []
+    by_critical_tag = defaultdict(list)
+    
+    for position, (_, project_keys, key_weights, total_weight) in enumerate(compiled):
+        if not total_weight:
+            continue
+        
+        non_critical_weight = sum(
+            weight for tag_key, weight in key_weights if tag_key not in CRITICAL_TAG_KEYS
+        )
+        if non_critical_weight / total_weight >= threshold:
+            always_scored.append(position)
+        else:
+            for tag_key in project_keys & CRITICAL_TAG_KEYS:
+                by_critical_tag[tag_key].append(position)
+    
+    return always_scored, dict(by_critical_tag)
+
+
+def load_compiled_projects(registry_path: Path, use_cache: bool = True) -> List[CompiledProject]:
+    """
+    Load and compile project fingerprints from a registry directory.
+    
+    The parsed projects are cached under the user cache directory, one file
+    per registry, together with a signature of the path, modification time
+    and size of every fingerprint file. Repeat runs against an unchanged
+    registry skip reading and parsing. Compilation always runs after
+    loading so tag keys are interned.
+    
+    Args:
+        registry_path: Path to project fingerprints directory
+        use_cache: Read and write the parsed registry cache
+        
+    Returns:
+        Output of compile_projects for the registry's projects
+    """
+    registry_dir = Path(registry_path).resolve()
+    fp_files = list(registry_dir.glob("*.json"))
+    
+    if not use_cache:
+        return compile_projects(_load_projects(fp_files))
+    
+    signature = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for fp_file in sorted(fp_files):
+        stat = fp_file.stat()
+        signature.update(f"|{fp_file.name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    
+    registry_id = hashlib.blake2b(str(registry_dir).encode(), digest_size=16).hexdigest()
+    cache_file = _cache_dir() / f"projects-{registry_id}.pkl"
+    
+    try:
+        with open(cache_file, "rb") as f:
+            cached_signature, projects = pickle.load(f)
+        if cached_signature == signature.hexdigest():
+            # Unpickled strings are not interned, so compile on every load
+            return compile_projects(projects)
+    except Exception:
+        # Missing, stale-format or unreadable cache; rebuild it below
+        pass
+    
+    projects = _load_projects(fp_files)
+    _write_cache(cache_file, (signature.hexdigest(), projects))
+    return compile_projects(projects)
+
+
+def _load_projects(fp_files: List[Path]) -> List[Dict[str, Any]]:
+    """Parse project fingerprint files."""
+    projects = []
+    for fp_file in fp_files:
+        with open(fp_file, "rb") as f:
+            projects.append(loads(f.read()))
+    return projects
+
+
+def _write_cache(cache_file: Path, payload: Any) -> None:
+    """Atomically replace a cache file, leaving nothing behind on failure."""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        # Caching is best effort; an unwritable cache only costs speed
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _cache_dir() -> Path:
+    """Return the directory used for cached registry data."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "cloud_asset_intel"
+
+
+def match_resource_to_compiled(
+    resource: Dict[str, Any],
+    compiled: List[CompiledProject],
+    threshold: float = 0.6,
+    index: Optional[ProjectIndex] = None,
+    include_details: bool = True,
+) -> Tuple[Optional[Dict[str, Any]], float, Dict[str, Any]]:
+    """
+    Match a resource to projects prepared by compile_projects.
     
+    Args:
+        resource: Resource dictionary with 'arn' and 'tags'
+        compiled: Output of compile_projects
+        threshold: Minimum confidence threshold
+        index: Optional build_project_index output (built for a threshold no
+            higher than this one) used to skip projects that cannot match.
+            The best match is unchanged, but the confidence reported for an
+            unmatched resource only covers the projects that were scored.
+        include_details: Build the match_details analysis for the best match
+        
+    Returns:
+        Tuple of (best_match_project, confidence, match_details)
+    """
     resource_tags = resource.get("tags", [])
     if not resource_tags:
         return None, 0.0, {"reason": "no_tags"}
     
-    for project in projects:
-        confidence = calculate_match_confidence(resource_tags, project)
-        
-        if confidence > best_confidence:
-            best_confidence = confidence
-            best_match = project
-            best_details = _generate_match_details(resource_tags, project, confidence)
+    resource_keys = set(tag["Key"] for tag in resource_tags)
+    best_match, best_keys, best_confidence = _best_match(resource_keys, compiled, index)
+    
+    best_details = {}
+    if include_details and best_match is not None:
+        best_details = _generate_match_details(resource_keys, best_keys, best_confidence)
     
     if best_confidence >= threshold:
         return best_match, best_confidence, best_details
@@ -120,15 +303,49 @@ def match_resource_to_projects(
     return None, best_confidence, best_details
 
 
+def _best_match(
+    resource_keys: AbstractSet[str],
+    compiled: List[CompiledProject],
+    index: Optional[ProjectIndex] = None,
+) -> Tuple[Optional[Dict[str, Any]], FrozenSet[str], float]:
+    """Find the highest-confidence project for a resource's tag keys."""
+    best_match = None
+    best_confidence = 0.0
+    best_keys: FrozenSet[str] = frozenset()
+    
+    candidates = compiled
+    if index is not None:
+        always_scored, by_critical_tag = index
+        positions = set(always_scored)
+        for tag_key in resource_keys & CRITICAL_TAG_KEYS:
+            positions.update(by_critical_tag.get(tag_key, ()))
+        # Keep registry order so ties resolve exactly as an unindexed scan would
+        candidates = [compiled[position] for position in sorted(positions)]
+    
+    # No project can match more weight than the resource's own tags carry;
+    # the slack keeps float summation order from pruning a genuine tie-breaker
+    resource_weight = sum(CRITICAL_TAGS.get(tag_key, 0.05) for tag_key in resource_keys) + 1e-9
+    
+    for project, project_keys, key_weights, total_weight in candidates:
+        if resource_weight <= best_confidence * total_weight:
+            continue
+        
+        confidence = _weighted_confidence(resource_keys, key_weights, total_weight)
+        
+        if confidence > best_confidence:
+            best_confidence = confidence
+            best_match = project
+            best_keys = project_keys
+    
+    return best_match, best_keys, best_confidence
+
+
 def _generate_match_details(
-    resource_tags: List[Dict[str, str]],
-    project: Dict[str, Any],
+    resource_keys: AbstractSet[str],
+    project_keys: FrozenSet[str],
     confidence: float,
 ) -> Dict[str, Any]:
     """Generate detailed match analysis."""
-    resource_keys = set(tag["Key"] for tag in resource_tags)
-    project_keys = set(project["fingerprints"]["key_fingerprint"])
-    
     matched = resource_keys & project_keys
     missing = project_keys - resource_keys
     extra = resource_keys - project_keys
@@ -154,7 +371,7 @@ def _generate_match_details(
         else:
             recommendation = "HIGH_MATCH - Likely belongs to this project"
     elif confidence >= 0.6:
-        critical_missing = missing & set(CRITICAL_TAGS.keys())
+        critical_missing = missing & CRITICAL_TAG_KEYS
         if critical_missing:
             recommendation = f"MEDIUM_MATCH - Missing critical tags: {list(critical_missing)}"
         else:
@@ -173,96 +390,88 @@ def _generate_match_details(
 
 
 def identify_orphans(
-    resources: List[Dict[str, Any]],
+    resources: Iterable[Dict[str, Any]],
     registry_path: Path,
     threshold: float = 0.6,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Identify orphaned resources by matching to known projects.
     
     Args:
-        resources: List of resource dictionaries
+        resources: Iterable of resource dictionaries, consumed in a single pass
         registry_path: Path to project fingerprints directory
         threshold: Confidence threshold for matching
+        use_cache: Reuse the parsed registry cache (see load_compiled_projects)
         
     Returns:
         Report dictionary with matched and orphaned resources
     """
-    # Load project fingerprints
-    projects = []
-    for fp_file in Path(registry_path).glob("*.json"):
-        with open(fp_file) as f:
-            projects.append(json.load(f))
+    compiled = load_compiled_projects(registry_path, use_cache=use_cache)
+    index = build_project_index(compiled, threshold)
     
-    matched_projects = defaultdict(list)
-    orphaned_resources = []
+    confidence_sums: Dict[str, float] = {}
+    matched_arns: Dict[str, List[str]] = {}
+    orphan_clusters_by_fp: Dict[Tuple[str, ...], List[str]] = {}
+    total_resources = 0
+    total_orphaned = 0
     
     for resource in resources:
-        project, confidence, details = match_resource_to_projects(
-            resource, projects, threshold
-        )
+        total_resources += 1
         
-        if project:
-            matched_projects[project["project_name"]].append({
-                "arn": resource["arn"],
-                "confidence": confidence,
-                "details": details,
-            })
+        # One pass over the tags serves both matching and orphan clustering
+        resource_keys = frozenset(tag["Key"] for tag in resource.get("tags", []))
+        project = None
+        if resource_keys:
+            project, _, confidence = _best_match(resource_keys, compiled, index)
+        
+        if project is not None and confidence >= threshold:
+            project_name = project["project_name"]
+            if project_name in matched_arns:
+                confidence_sums[project_name] += confidence
+                matched_arns[project_name].append(resource["arn"])
+            else:
+                confidence_sums[project_name] = confidence
+                matched_arns[project_name] = [resource["arn"]]
         else:
-            orphaned_resources.append({
-                "arn": resource["arn"],
-                "tags": resource.get("tags", []),
-                "fingerprint": list(extract_key_fingerprint(resource.get("tags", []))),
-            })
+            fp = tuple(sorted(resource_keys))
+            orphan_clusters_by_fp.setdefault(fp, []).append(resource["arn"])
+            total_orphaned += 1
     
     # Format matched projects
-    matched_list = []
-    for project_name, resources_list in matched_projects.items():
+    matched_list: List[Dict[str, Any]] = []
+    for project_name, arns in matched_arns.items():
         matched_list.append({
             "project_name": project_name,
-            "resource_count": len(resources_list),
-            "confidence": sum(r["confidence"] for r in resources_list) / len(resources_list),
-            "resources": [r["arn"] for r in resources_list],
+            "resource_count": len(arns),
+            "confidence": confidence_sums[project_name] / len(arns),
+            "resources": arns,
         })
     
-    # Cluster orphans by fingerprint
-    orphan_clusters = _cluster_orphans(orphaned_resources)
+    # Format orphan clusters
+    orphan_clusters = [
+        {
+            "cluster_id": f"orphan-{i}",
+            "fingerprint": list(fingerprint),
+            "resource_count": len(arns),
+            "resources": arns,
+            "recommendation": _get_orphan_recommendation(len(arns), list(fingerprint)),
+        }
+        for i, (fingerprint, arns) in enumerate(orphan_clusters_by_fp.items(), 1)
+    ]
     
     total_matched = sum(p["resource_count"] for p in matched_list)
     
     return {
         "report_date": datetime.utcnow().isoformat() + "Z",
-        "total_resources": len(resources),
+        "total_resources": total_resources,
         "matched_resources": total_matched,
-        "orphaned_resources": len(orphaned_resources),
+        "orphaned_resources": total_orphaned,
         "matched_projects": matched_list,
         "orphan_clusters": orphan_clusters,
     }
 
 
-def _cluster_orphans(orphaned_resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Cluster orphaned resources by fingerprint."""
-    from collections import defaultdict
-    
-    clusters = defaultdict(list)
-    
-    for resource in orphaned_resources:
-        fp = tuple(resource["fingerprint"])
-        clusters[fp].append(resource["arn"])
-    
-    cluster_list = []
-    for i, (fingerprint, arns) in enumerate(clusters.items(), 1):
-        cluster_list.append({
-            "cluster_id": f"orphan-{i}",
-            "fingerprint": list(fingerprint),
-            "resource_count": len(arns),
-            "resources": arns,
-            "recommendation": _get_orphan_recommendation(len(arns), list(fingerprint)),
-        })
-    
-    return cluster_list
-
-
 def _get_orphan_recommendation(count: int, fingerprint: List[str]) -> str:
     """Generate recommendation for orphan cluster."""
     if count == 1:
@@ -7,11 +7,14 @@ import boto3
 from rich.console import Console
 from rich.prompt import Prompt
 
-from .fingerprint import extract_key_fingerprint, extract_keyvalue_fingerprint
+from .fingerprint import extract_key_fingerprints, extract_keyvalue_fingerprint
 
 
 console = Console()
 
+# Maximum number of ARNs accepted by a single get_resources call
+ARN_BATCH_SIZE = 100
+
 
 def register_project_fingerprint(
     name: str,
@@ -74,6 +77,8 @@ def register_project_fingerprint(
             "keyvalue_fingerprints": [],
         }
     
+    now = datetime.utcnow().isoformat() + "Z"
+    
     return {
         "project_name": name,
         "description": description,
@@ -81,38 +86,52 @@ def register_project_fingerprint(
         "state_file_location": state_location,
         "repository": repository,
         "metadata": {
-            "created": datetime.utcnow().isoformat() + "Z",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
+            "created": now,
+            "last_updated": now,
             "version": "1.0.0",
         },
     }
 
 
+def _get_tag_lists(client: Any, arns: List[str]) -> List[List[Dict[str, str]]]:
+    """Fetch the non-empty tag lists for a batch of ARNs."""
+    response = client.get_resources(ResourceARNList=arns)
+    tag_lists = []
+    for resource in response.get("ResourceTagMappingList", []):
+        tags = [
+            {"Key": tag["Key"], "Value": tag["Value"]}
+            for tag in resource.get("Tags", [])
+        ]
+        if tags:
+            tag_lists.append(tags)
+    return tag_lists
+
+
 def _extract_fingerprints_from_arns(arns: List[str]) -> Dict[str, Any]:
     """Extract fingerprints from sample resource ARNs."""
     session = boto3.Session()
     client = session.client("resourcegroupstaggingapi")
     
-    # Get tags for each ARN
+    # Get tags in batches (the API accepts up to 100 ARNs per call)
     all_tags = []
-    for arn in arns:
+    for i in range(0, len(arns), ARN_BATCH_SIZE):
+        batch = arns[i:i + ARN_BATCH_SIZE]
         try:
-            response = client.get_resources(ResourceARNList=[arn])
-            for resource in response.get("ResourceTagMappingList", []):
-                tags = [
-                    {"Key": tag["Key"], "Value": tag["Value"]}
-                    for tag in resource.get("Tags", [])
-                ]
-                if tags:
-                    all_tags.append(tags)
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not get tags for {arn}: {e}[/yellow]")
+            all_tags.extend(_get_tag_lists(client, batch))
+        except Exception:
+            # One bad ARN fails the whole call, so retry the batch one ARN
+            # at a time to keep the good samples
+            for arn in batch:
+                try:
+                    all_tags.extend(_get_tag_lists(client, [arn]))
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not get tags for {arn}: {e}[/yellow]")
     
     if not all_tags:
         raise ValueError("No tags found on sample resources")
     
     # Extract common key fingerprint
-    key_fingerprints = [extract_key_fingerprint(tags) for tags in all_tags]
+    key_fingerprints = extract_key_fingerprints(all_tags)
     common_keys = set(key_fingerprints[0])
     for fp in key_fingerprints[1:]:
         common_keys &= set(fp)
@@ -1,5 +1,7 @@
 """AWS resource scanning and discovery."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -35,14 +37,32 @@ def scan_aws_resources(
         
         all_resources = []
         
-        for region in regions:
+        # boto3 sessions are not thread-safe, so create each regional client
+        # up front and only share the (thread-safe) clients with workers
+        clients = {
+            region: session.client("resourcegroupstaggingapi", region_name=region)
+            for region in regions
+        }
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(regions)))) as executor:
+            futures = [
+                executor.submit(_scan_region, clients[region], region, resource_types)
+                for region in regions
+            ]
             try:
-                resources = _scan_region(session, region, resource_types)
-                all_resources.extend(resources)
-            except ClientError as e:
-                # Skip regions where we don't have access
-                if e.response["Error"]["Code"] != "UnauthorizedOperation":
-                    raise
+                # Collect in submission order so output stays stable across runs
+                for future in futures:
+                    try:
+                        all_resources.extend(future.result())
+                    except ClientError as e:
+                        # Skip regions where we don't have access
+                        if e.response["Error"]["Code"] != "UnauthorizedOperation":
+                            raise
+            except BaseException:
+                # Drop regions that haven't started so a fatal error
+                # surfaces without scanning the rest of the account
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         return {
             "scan_date": datetime.utcnow().isoformat() + "Z",
@@ -62,47 +82,35 @@ def scan_aws_resources(
 
 
 def _scan_region(
-    session: boto3.Session,
+    client: Any,
     region: str,
     resource_types: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Scan a single AWS region for tagged resources."""
-    client = session.client("resourcegroupstaggingapi", region_name=region)
-    
     resources = []
-    pagination_token = None
     
-    while True:
-        kwargs = {"ResourcesPerPage": 100}
-        
-        if resource_types:
-            kwargs["ResourceTypeFilters"] = resource_types
-        
-        if pagination_token:
-            kwargs["PaginationToken"] = pagination_token
-        
-        try:
-            response = client.get_resources(**kwargs)
-            
-            for resource in response.get("ResourceTagMappingList", []):
+    kwargs: Dict[str, Any] = {"PaginationConfig": {"PageSize": 100}}
+    if resource_types:
+        kwargs["ResourceTypeFilters"] = resource_types
+    
+    paginator = client.get_paginator("get_resources")
+    
+    try:
+        for page in paginator.paginate(**kwargs):
+            for resource in page.get("ResourceTagMappingList", []):
                 resources.append({
                     "arn": resource["ResourceARN"],
                     "service": _extract_service_from_arn(resource["ResourceARN"]),
                     "region": region,
                     "tags": [
-                        {"Key": tag["Key"], "Value": tag["Value"]}
+                        {"Key": sys.intern(tag["Key"]), "Value": tag["Value"]}
                         for tag in resource.get("Tags", [])
                     ],
                 })
-            
-            pagination_token = response.get("PaginationToken")
-            if not pagination_token:
-                break
-                
-        except ClientError as e:
-            # Skip if we don't have permission in this region
-            if e.response["Error"]["Code"] in ["AccessDeniedException", "UnauthorizedOperation"]:
-                break
+    
+    except ClientError as e:
+        # Skip if we don't have permission in this region
+        if e.response["Error"]["Code"] not in ["AccessDeniedException", "UnauthorizedOperation"]:
             raise
     
     return resources
@@ -111,7 +119,8 @@ def _scan_region(
 def _extract_service_from_arn(arn: str) -> str:
     """Extract service name from ARN."""
     # ARN format: arn:partition:service:region:account-id:resource
-    parts = arn.split(":")
-    if len(parts) >= 3:
-        return parts[2]
-    return "unknown"
+    _, _, rest = arn.partition(":")
+    _, sep, rest = rest.partition(":")
+    if not sep:
+        return "unknown"
+    return rest.partition(":")[0]
@@ -1,9 +1,13 @@
 """Tests for fingerprint extraction."""
 
+import time
+
 import pytest
 
 from cloud_asset_intel.fingerprint import (
+    clear_fingerprint_cache,
     extract_key_fingerprint,
+    extract_key_fingerprints,
     extract_keyvalue_fingerprint,
 )
 
@@ -44,6 +48,19 @@ def test_extract_keyvalue_fingerprint():
     assert actual == expected
 
 
+def test_extract_keyvalue_fingerprint_non_string_value():
+    """Test that non-string tag values pass through unchanged."""
+    tags = [
+        {"Key": "Port", "Value": "1"},
+        {"Key": "Owner", "Value": None},
+    ]
+    
+    expected = (("Owner", None), ("Port", "1"))
+    actual = extract_keyvalue_fingerprint(tags)
+    
+    assert actual == expected
+
+
 def test_fingerprint_ordering():
     """Test that fingerprints are consistently ordered."""
     tags1 = [
@@ -63,3 +80,60 @@ def test_fingerprint_ordering():
     
     assert fp1 == fp2
     assert fp1 == ("A", "M", "Z")
+
+
+def test_fingerprint_cache_is_transparent():
+    """Test that memoized fingerprints match freshly computed ones."""
+    tags = [
+        {"Key": "Project", "Value": "webapp"},
+        {"Key": "Environment", "Value": "prod"},
+    ]
+    
+    clear_fingerprint_cache()
+    first = extract_keyvalue_fingerprint(tags)
+    second = extract_keyvalue_fingerprint(tags)
+    clear_fingerprint_cache()
+    third = extract_keyvalue_fingerprint(tags)
+    
+    assert first == second == third == (("Environment", "prod"), ("Project", "webapp"))
+    assert extract_key_fingerprint(tags) == ("Environment", "Project")
+
+
+@pytest.fixture
+def large_tags():
+    """Tag list large enough to expose algorithmic regressions."""
+    return [{"Key": f"k{i % 97}", "Value": f"v{i % 131}"} for i in range(10_000)]
+
+
+@pytest.mark.parametrize("extract", [extract_key_fingerprint, extract_keyvalue_fingerprint])
+def test_fingerprint_large_input(large_tags, extract):
+    """Test fingerprint extraction stays correct and fast on 10k tags."""
+    clear_fingerprint_cache()
+    
+    start = time.perf_counter()
+    fp = extract(large_tags)
+    elapsed = time.perf_counter() - start
+    
+    assert len(fp) == len(large_tags)
+    assert list(fp) == sorted(fp)
+    # Generous bound: catches per-tag Python callbacks, not machine noise
+    assert elapsed < 0.25
+
+
+def test_extract_key_fingerprints_batch():
+    """Test batch extraction matches per-resource extraction and ordering."""
+    tags1 = [
+        {"Key": "Z", "Value": "last"},
+        {"Key": "A", "Value": "first"},
+        {"Key": "M", "Value": "middle"},
+    ]
+    
+    tags2 = [
+        {"Key": "M", "Value": "middle"},
+        {"Key": "A", "Value": "first"},
+        {"Key": "Z", "Value": "last"},
+    ]
+    
+    fps = extract_key_fingerprints([tags1, tags2, []])
+    
+    assert fps == [("A", "M", "Z"), ("A", "M", "Z"), ()]
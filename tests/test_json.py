@@ -0,0 +1,39 @@
+"""Tests for JSON helpers."""
+
+import io
+
+import pytest
+
+from cloud_asset_intel import _json
+
+
+DOCUMENT = b'{"scan_date": "2025-01-01", "resources": [{"arn": "a", "size": 1.5}, {"arn": "b"}]}'
+
+
+def test_iter_items_fallback(monkeypatch):
+    """Test iter_items without ijson installed."""
+    monkeypatch.setattr(_json, "ijson", None)
+
+    items = list(_json.iter_items(io.BytesIO(DOCUMENT), "resources"))
+
+    assert items == [{"arn": "a", "size": 1.5}, {"arn": "b"}]
+
+
+def test_iter_items_streaming():
+    """Test iter_items streams with ijson and yields plain floats."""
+    ijson = pytest.importorskip("ijson")
+    assert _json.ijson is ijson
+
+    items = list(_json.iter_items(io.BytesIO(DOCUMENT), "resources"))
+
+    assert items == [{"arn": "a", "size": 1.5}, {"arn": "b"}]
+    assert type(items[0]["size"]) is float
+
+
+def test_dumps_round_trip():
+    """Test compact and indented output both parse back."""
+    obj = {"a": [1, 2], "b": None}
+
+    assert _json.loads(_json.dumps(obj)) == obj
+    assert _json.loads(_json.dumps(obj, indent=True)) == obj
+    assert b"\n" not in _json.dumps(obj)
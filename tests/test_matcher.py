@@ -0,0 +1,235 @@
+"""Tests for resource matching."""
+
+import json
+import os
+import sys
+
+import pytest
+
+from cloud_asset_intel import matcher
+from cloud_asset_intel.matcher import (
+    build_project_index,
+    calculate_match_confidence,
+    compile_projects,
+    load_compiled_projects,
+    match_resource_to_compiled,
+)
+
+
+def _project(name, keys):
+    """Build a minimal project fingerprint."""
+    return {"project_name": name, "fingerprints": {"key_fingerprint": keys}}
+
+
+def _resource(*keys):
+    """Build a resource carrying the given tag keys."""
+    return {
+        "arn": f"arn:aws:s3:::{'-'.join(keys) or 'untagged'}",
+        "tags": [{"Key": key, "Value": "x"} for key in keys],
+    }
+
+
+PROJECTS = [
+    _project("webapp", ["Project", "Environment", "ManagedBy"]),
+    _project("billing", ["Project", "CostCenter", "Owner"]),
+    _project("labels-only", ["Owner", "Team", "Stack"]),
+    _project("empty", []),
+]
+
+RESOURCES = [
+    _resource("Project", "Environment", "ManagedBy"),
+    _resource("Project", "CostCenter"),
+    _resource("Owner", "Team", "Stack"),
+    _resource("Owner", "Team"),
+    _resource("Environment"),
+    _resource("Name"),
+    _resource(),
+]
+
+
+def _match_name(resource, compiled, threshold, index=None):
+    """Return the matched project name (or None) for a resource."""
+    project, _, _ = match_resource_to_compiled(resource, compiled, threshold, index)
+    return project["project_name"] if project else None
+
+
+def test_build_project_index_always_scores_non_critical_projects():
+    """Test that projects matchable without critical tags are always scored."""
+    compiled = compile_projects(PROJECTS)
+    always_scored, by_critical_tag = build_project_index(compiled, 0.6)
+
+    # labels-only has no critical tags; empty can never match
+    assert always_scored == [2]
+    assert 3 not in always_scored
+    assert all(3 not in positions for positions in by_critical_tag.values())
+    assert by_critical_tag["Project"] == [0, 1]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.6, 0.9])
+def test_index_matches_unindexed_scan(threshold):
+    """Test that the project index never changes the best match."""
+    compiled = compile_projects(PROJECTS)
+    index = build_project_index(compiled, threshold)
+
+    for resource in RESOURCES:
+        expected = _match_name(resource, compiled, threshold)
+        assert _match_name(resource, compiled, threshold, index) == expected
+
+
+def test_non_critical_project_matches_through_index():
+    """Test that a project without critical tags is still matched via the index."""
+    compiled = compile_projects(PROJECTS)
+    index = build_project_index(compiled, 0.6)
+
+    assert _match_name(_resource("Owner", "Team", "Stack"), compiled, 0.6, index) == "labels-only"
+
+
+def test_empty_project_never_matches():
+    """Test that a project with no keys is skipped rather than dividing by zero."""
+    compiled = compile_projects([_project("empty", [])])
+    index = build_project_index(compiled, 0.0)
+
+    for resource in RESOURCES:
+        assert _match_name(resource, compiled, 0.0) is None
+        assert _match_name(resource, compiled, 0.0, index) is None
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_tie_break_prefers_first_registered_project(use_index):
+    """Test that equally scored projects resolve to registry order."""
+    first = _project("first", ["Project", "Environment"])
+    second = _project("second", ["Project", "Environment"])
+    resource = _resource("Project", "Environment")
+
+    for projects, expected in (([first, second], "first"), ([second, first], "second")):
+        compiled = compile_projects(projects)
+        index = build_project_index(compiled, 0.6) if use_index else None
+        assert _match_name(resource, compiled, 0.6, index) == expected
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_threshold_zero(use_index):
+    """Test that a zero threshold still requires some overlap to match."""
+    compiled = compile_projects(PROJECTS)
+    index = build_project_index(compiled, 0.0) if use_index else None
+
+    assert _match_name(_resource("Environment"), compiled, 0.0, index) == "webapp"
+    assert _match_name(_resource("Name"), compiled, 0.0, index) is None
+    assert _match_name(_resource(), compiled, 0.0, index) is None
+
+
+def test_pruning_keeps_later_better_match(monkeypatch):
+    """Test that the upper-bound prune still finds a later, stronger project."""
+    projects = [
+        _project("partial", ["Project", "Owner", "Team"]),
+        _project("exact", ["Project"]),
+        _project("wide", ["Project", "Environment", "ManagedBy", "CostCenter"]),
+    ]
+    compiled = compile_projects(projects)
+    resource = _resource("Project")
+
+    # Brute force: first project with the highest confidence wins
+    scores = [calculate_match_confidence(resource["tags"], p) for p in projects]
+    expected = projects[scores.index(max(scores))]
+
+    # Record which projects get scored, identified by their total weight
+    total_weights = {p["project_name"]: total for p, _, _, total in compiled}
+    assert len(set(total_weights.values())) == len(projects)
+    scored = []
+    weighted_confidence = matcher._weighted_confidence
+
+    def recording_weighted_confidence(resource_keys, key_weights, total_weight):
+        scored.append(total_weight)
+        return weighted_confidence(resource_keys, key_weights, total_weight)
+
+    monkeypatch.setattr(matcher, "_weighted_confidence", recording_weighted_confidence)
+
+    project, confidence, _ = match_resource_to_compiled(resource, compiled, 0.6)
+
+    # "exact" scores 1.0, so "wide" can be skipped without scoring it
+    assert scored == [total_weights["partial"], total_weights["exact"]]
+
+    assert project is expected
+    assert project["project_name"] == "exact"
+    assert confidence == max(scores) == 1.0
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Registry directory with one project and an isolated cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    registry_dir = tmp_path / "registry"
+    registry_dir.mkdir()
+    (registry_dir / "webapp.json").write_text(json.dumps(PROJECTS[0]))
+    return registry_dir
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    """Count how often registry files are parsed from disk."""
+    calls = []
+    load_projects = matcher._load_projects
+
+    def counting_load_projects(fp_files):
+        calls.append(fp_files)
+        return load_projects(fp_files)
+
+    monkeypatch.setattr(matcher, "_load_projects", counting_load_projects)
+    return calls
+
+
+def test_registry_cache_miss_then_hit(registry, tmp_path, load_calls):
+    """Test that a second load is served from the cache with interned keys."""
+    first = load_compiled_projects(registry)
+    second = load_compiled_projects(registry)
+
+    assert len(load_calls) == 1
+    assert first == second
+    assert len(list((tmp_path / "cache" / "cloud_asset_intel").glob("projects-*.pkl"))) == 1
+    assert all(key is sys.intern(key) for key in second[0][1])
+
+
+def test_registry_cache_invalidated_by_mtime(registry, tmp_path, load_calls):
+    """Test that touching a registry file forces a reparse into the same cache file."""
+    load_compiled_projects(registry)
+
+    fp_file = registry / "webapp.json"
+    stat = fp_file.stat()
+    os.utime(fp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    load_compiled_projects(registry)
+    load_compiled_projects(registry)
+
+    assert len(load_calls) == 2
+    assert len(list((tmp_path / "cache" / "cloud_asset_intel").glob("*"))) == 1
+
+
+def test_registry_cache_disabled(registry, tmp_path, load_calls):
+    """Test that use_cache=False neither reads nor writes the cache."""
+    load_compiled_projects(registry, use_cache=False)
+    load_compiled_projects(registry, use_cache=False)
+
+    assert len(load_calls) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_registry_cache_write_failure_leaves_no_temp_files(registry, tmp_path, monkeypatch):
+    """Test that a failed cache write is ignored and cleaned up."""
+    def failing_dump(*args, **kwargs):
+        raise TypeError("cannot pickle")
+
+    monkeypatch.setattr(matcher.pickle, "dump", failing_dump)
+
+    assert load_compiled_projects(registry)[0][0]["project_name"] == "webapp"
+    assert list((tmp_path / "cache" / "cloud_asset_intel").glob("*")) == []
+
+
+def test_identify_orphans_consumes_generator(registry):
+    """Test that identify_orphans works in one pass over a non-sized iterable."""
+    resources = (resource for resource in RESOURCES)
+
+    report = matcher.identify_orphans(resources, registry, threshold=0.6, use_cache=False)
+
+    assert report["total_resources"] == len(RESOURCES)
+    assert report["matched_resources"] == 1
+    assert report["orphaned_resources"] == len(RESOURCES) - 1
+    assert sum(c["resource_count"] for c in report["orphan_clusters"]) == len(RESOURCES) - 1